@@ -24,8 +24,9 @@ Data Sources:
     - ioreg -rn AppleSmartBattery  : Battery and adapter hardware data
     - pmset -g batt                 : Battery percentage and status
     - pmset -g therm                : Thermal throttling information
-    - top -l 1                      : CPU usage statistics
-    - vm_stat                       : Memory page statistics
+    - host_processor_info()         : CPU tick counters (via ctypes)
+    - host_statistics64()           : Memory page statistics (via ctypes)
+    - top -l 1, vm_stat             : CPU/memory fallback without libSystem
     - diskutil info /               : APFS disk space information
 
 Usage:
@@ -41,6 +42,11 @@ Requirements:
     - Python 3.6+
     - No external dependencies (uses only standard library)
 
+Optional:
+    The module is fully type-annotated so it can be compiled ahead of time
+    with mypyc (``mypyc power_monitor.py``) and started with
+    ``python3 -c "import power_monitor; power_monitor.main()"``.
+
 Repository: https://github.com/dbn-b4e/MacJet
 
 Author:  B4E SRL - David Baldwin
@@ -52,32 +58,61 @@ Date:    2025-11-29
 """
 
 import subprocess
+import ctypes
+import ctypes.util
+import _ctypes  # noqa: F401 - mypyc resolves ctypes.Structure through it
 import re
 import time
+import bisect
 import sys
 import curses
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import (Any, Callable, Deque, Dict, Generic, Iterable, List,
+                    Optional, Sequence, Tuple, TypeVar, Union)
+
+T = TypeVar('T')
 
 
 # =============================================================================
-# Shell Command Execution
+# Command Execution
 # =============================================================================
 
-def run_cmd(cmd):
+# Every command needed for one refresh, keyed by data source
+CMDS: Dict[str, List[str]] = {
+    'ioreg': ['ioreg', '-rn', 'AppleSmartBattery'],
+    'pmset_batt': ['pmset', '-g', 'batt'],
+    'pmset_therm': ['pmset', '-g', 'therm'],
+    'top': ['top', '-l', '1', '-n', '0', '-s', '0'],
+    'vm_stat': ['vm_stat'],
+    'memsize': ['sysctl', '-n', 'hw.memsize'],
+    'pagesize': ['pagesize'],
+    'diskutil': ['diskutil', 'info', '/'],
+}
+
+# Commands block on fork/exec, so they run side by side on worker threads
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def run_cmd(cmd: List[str]) -> str:
     """
-    Execute a shell command and return its stdout.
+    Execute a command and return its stdout.
 
     Args:
-        cmd (str): Shell command to execute
+        cmd (list[str]): Program and arguments to execute
 
     Returns:
         str: Command stdout, or empty string on error/timeout
 
     Note:
         Commands are executed with a 5-second timeout to prevent hangs.
+        No shell is involved, so each call is a single process spawn
+        (posix_spawn where CPython supports it).
     """
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=5)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
         return result.stdout
     except subprocess.TimeoutExpired:
         return ""
@@ -85,16 +120,327 @@ def run_cmd(cmd):
         return ""
 
 
+# =============================================================================
+# Mach Host Statistics
+# =============================================================================
+
+_PROCESSOR_CPU_LOAD_INFO = 2  # processor_flavor_t: per-CPU tick counters
+_CPU_STATE_MAX = 4            # user, system, idle, nice
+_HOST_VM_INFO64 = 4           # host_flavor_t: struct vm_statistics64
+
+
+class _VMStatistics64(ctypes.Structure):
+    """Mirror of struct vm_statistics64 from <mach/vm_statistics.h>."""
+    _fields_ = [
+        ('free_count', ctypes.c_uint32),
+        ('active_count', ctypes.c_uint32),
+        ('inactive_count', ctypes.c_uint32),
+        ('wire_count', ctypes.c_uint32),
+        ('zero_fill_count', ctypes.c_uint64),
+        ('reactivations', ctypes.c_uint64),
+        ('pageins', ctypes.c_uint64),
+        ('pageouts', ctypes.c_uint64),
+        ('faults', ctypes.c_uint64),
+        ('cow_faults', ctypes.c_uint64),
+        ('lookups', ctypes.c_uint64),
+        ('hits', ctypes.c_uint64),
+        ('purges', ctypes.c_uint64),
+        ('purgeable_count', ctypes.c_uint32),
+        ('speculative_count', ctypes.c_uint32),
+        ('decompressions', ctypes.c_uint64),
+        ('compressions', ctypes.c_uint64),
+        ('swapins', ctypes.c_uint64),
+        ('swapouts', ctypes.c_uint64),
+        ('compressor_page_count', ctypes.c_uint32),
+        ('throttled_count', ctypes.c_uint32),
+        ('external_page_count', ctypes.c_uint32),
+        ('internal_page_count', ctypes.c_uint32),
+        ('total_uncompressed_pages_in_compressor', ctypes.c_uint64),
+    ]
+
+
+_HOST_VM_INFO64_COUNT = ctypes.sizeof(_VMStatistics64) // ctypes.sizeof(ctypes.c_int32)
+
+
+def _load_libsystem() -> Optional[ctypes.CDLL]:
+    """
+    Bind the Mach host calls used for CPU and memory sampling.
+
+    Returns:
+        ctypes.CDLL: libSystem with signatures set, or None if the calls
+            are unavailable (callers then fall back to running commands)
+    """
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library('c'))
+        lib.mach_host_self.argtypes = []
+        lib.mach_host_self.restype = ctypes.c_uint
+        lib.host_processor_info.argtypes = [
+            ctypes.c_uint, ctypes.c_int, ctypes.POINTER(ctypes.c_uint),
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint)), ctypes.POINTER(ctypes.c_uint)]
+        lib.host_processor_info.restype = ctypes.c_int
+        lib.host_statistics64.argtypes = [
+            ctypes.c_uint, ctypes.c_int, ctypes.POINTER(_VMStatistics64),
+            ctypes.POINTER(ctypes.c_uint)]
+        lib.host_statistics64.restype = ctypes.c_int
+        lib.host_page_size.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_size_t)]
+        lib.host_page_size.restype = ctypes.c_int
+        lib.sysctlbyname.argtypes = [
+            ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p, ctypes.c_size_t]
+        lib.sysctlbyname.restype = ctypes.c_int
+        lib.vm_deallocate.argtypes = [ctypes.c_uint, ctypes.c_size_t, ctypes.c_size_t]
+        lib.vm_deallocate.restype = ctypes.c_int
+        ctypes.c_uint.in_dll(lib, 'mach_task_self_')
+    except (OSError, AttributeError, TypeError, ValueError):
+        return None
+    return lib
+
+
+_libc: Any = _load_libsystem()
+
+# Host port for the calls above. Fetched once: every mach_host_self() call
+# adds a user reference to the send right that would need releasing.
+_host_port: int = _libc.mach_host_self() if _libc is not None else 0
+
+# (busy, total, usage) from the previous host_processor_info() sample
+_cpu_ticks_prev: Tuple[int, int, float] = (0, 0, 0.0)
+
+
+def _host_cpu_usage() -> Optional[float]:
+    """
+    Get CPU usage from the kernel's per-CPU tick counters.
+
+    Usage is computed from the tick deltas since the previous call; the
+    first call reports the average since boot, and a call with no ticks
+    elapsed repeats the previous value.
+
+    Returns:
+        float: CPU usage percentage (0-100), or None if the call failed
+    """
+    global _cpu_ticks_prev
+
+    cpu_count = ctypes.c_uint()
+    ticks = ctypes.POINTER(ctypes.c_uint)()
+    ticks_count = ctypes.c_uint()
+    kr = _libc.host_processor_info(
+        _host_port, _PROCESSOR_CPU_LOAD_INFO,
+        ctypes.byref(cpu_count), ctypes.byref(ticks), ctypes.byref(ticks_count))
+    if kr != 0:
+        return None
+
+    try:
+        busy = total = 0
+        for cpu in range(cpu_count.value):
+            user, system, idle, nice = ticks[cpu * _CPU_STATE_MAX:(cpu + 1) * _CPU_STATE_MAX]
+            # top folds nice time into its "user" figure
+            busy += user + system + nice
+            total += user + system + idle + nice
+    finally:
+        # The tick array is allocated in our task by the kernel
+        task = ctypes.c_uint.in_dll(_libc, 'mach_task_self_').value
+        _libc.vm_deallocate(task, ctypes.cast(ticks, ctypes.c_void_p).value,
+                            ticks_count.value * ctypes.sizeof(ctypes.c_uint))
+
+    prev_busy, prev_total, usage = _cpu_ticks_prev
+    if total > prev_total:
+        usage = (busy - prev_busy) / (total - prev_total) * 100
+    _cpu_ticks_prev = (busy, total, usage)
+    return usage
+
+
+def _host_memory_pages() -> Optional[Tuple[Dict[str, int], int, int]]:
+    """
+    Get page counts, page size and RAM size without spawning commands.
+
+    Returns:
+        tuple: (pages, page_size, total_bytes) where pages uses the same
+            labels as vm_stat, or None if a call failed
+    """
+    stats = _VMStatistics64()
+    count = ctypes.c_uint(_HOST_VM_INFO64_COUNT)
+    if _libc.host_statistics64(_host_port, _HOST_VM_INFO64, ctypes.byref(stats), ctypes.byref(count)) != 0:
+        return None
+
+    page_size = ctypes.c_size_t()
+    if _libc.host_page_size(_host_port, ctypes.byref(page_size)) != 0:
+        return None
+
+    memsize = ctypes.c_uint64()
+    size = ctypes.c_size_t(ctypes.sizeof(memsize))
+    if _libc.sysctlbyname(b'hw.memsize', ctypes.byref(memsize), ctypes.byref(size), None, 0) != 0:
+        return None
+
+    # vm_stat reports free pages net of speculative ones
+    pages = {
+        'Pages free': stats.free_count - stats.speculative_count,
+        'Pages active': stats.active_count,
+        'Pages inactive': stats.inactive_count,
+        'Pages speculative': stats.speculative_count,
+        'Pages wired down': stats.wire_count,
+        'Pages occupied by compressor': stats.compressor_page_count,
+        'Pages purgeable': stats.purgeable_count,
+    }
+    return pages, page_size.value, memsize.value
+
+
 # =============================================================================
 # Data Collection Functions
 # =============================================================================
 
-def parse_ioreg_battery():
+# Patterns are compiled once at import; each parser scans its output once.
+# Fixed "key = value" fields use the str.find() scanners below instead.
+_CELL_VOLTAGE_RE = re.compile(r'"CellVoltage"\s*=\s*\((\d+),(\d+),(\d+)\)')
+_CPU_RE = re.compile(r'(\d+\.?\d*)%\s*user.*?(\d+\.?\d*)%\s*sys')
+_DISK_RE = re.compile(
+    r'(?P<k>Container Total Space|Container Free Space|Volume Used Space):'
+    r'\s*(?P<size>[\d.]+)\s*(?P<unit>TB|GB|MB)'
+)
+
+
+def _find_value(text: str, key: str) -> str:
+    """
+    Return the text that follows the first occurrence of key.
+
+    Skips the spaces, tabs and '=' between a key and its value, so both
+    ``"Key" = 12`` and ``"Key"=12`` work.
+
+    Args:
+        text (str): Command output to search
+        key (str): Literal key, including any surrounding quotes
+
+    Returns:
+        str: Up to 32 characters after the separator, or '' if not found
+    """
+    i = text.find(key)
+    if i < 0:
+        return ''
+    i += len(key)
+    return text[i:i + 32].lstrip(' \t=')
+
+
+def _find_int(text: str, key: str, default: int = 0) -> int:
+    """
+    Read the integer value that follows key (see _find_value()).
+
+    Returns:
+        int: Parsed value, or default if the key is missing or not numeric
+    """
+    value = _find_value(text, key)
+    end = 1 if value[:1] == '-' else 0
+    while end < len(value) and value[end] in '0123456789':
+        end += 1
+    try:
+        return int(value[:end])
+    except ValueError:
+        return default
+
+
+def _find_flag(text: str, key: str) -> bool:
+    """
+    Read the Yes/No value that follows key (see _find_value()).
+
+    Returns:
+        bool: True if the value is Yes
+    """
+    return _find_value(text, key).startswith('Yes')
+
+
+class _TTLCache(Generic[T]):
+    """
+    Cache a zero-argument collector's result for ttl seconds.
+
+    Slow-changing sources skip their command entirely while the cached
+    value is fresh, whatever tier triggers them. Like lru_cache, the
+    wrapper exposes cache_clear() to force the next call through.
+
+    Args:
+        func (callable): Collector to wrap
+        ttl (float): Seconds a result stays valid
+    """
+
+    def __init__(self, func: Callable[[], T], ttl: float) -> None:
+        self.func = func
+        self.ttl = ttl
+        self._value: Optional[T] = None
+        self._time: Optional[float] = None
+
+    def __call__(self) -> T:
+        now = time.monotonic()
+        if self._time is not None and now - self._time < self.ttl:
+            return self._value  # type: ignore[return-value]
+        value = self.func()
+        self._time = now
+        self._value = value
+        return value
+
+    def cache_clear(self) -> None:
+        """Drop the cached value."""
+        self._time = None
+        self._value = None
+
+
+def _ttl_cache(ttl: float) -> Callable[[Callable[[], T]], _TTLCache[T]]:
+    """
+    Decorator form of _TTLCache.
+
+    Args:
+        ttl (float): Seconds a result stays valid
+    """
+    return lambda func: _TTLCache(func, ttl)
+
+
+# Battery fields read from ioreg: (quoted ioreg key, info key, kind), where
+# kind selects the value reader ('int', 'flag' or the 'cells' tuple)
+_IOREG_FIELDS = (
+    # Current capacity - how much charge the battery currently holds
+    ('"CurrentCapacity"', 'current_capacity_mah', 'int'),
+    # Max capacity - the current maximum the battery can hold (degrades over time)
+    ('"MaxCapacity"', 'max_capacity_mah', 'int'),
+    # Design capacity - the original factory capacity
+    ('"DesignCapacity"', 'design_capacity_mah', 'int'),
+    # Battery voltage - current voltage across the battery
+    ('"Voltage"', 'voltage_mv', 'int'),
+    # Instantaneous amperage - positive when charging, negative when discharging
+    ('"InstantAmperage"', 'amperage_ma', 'int'),
+    # Charging state
+    ('"IsCharging"', 'is_charging', 'flag'),
+    # External power connected
+    ('"ExternalConnected"', 'external_connected', 'flag'),
+    # Cycle count - number of complete charge/discharge cycles
+    ('"CycleCount"', 'cycle_count', 'int'),
+    # Adapter wattage rating
+    ('"Watts"', 'adapter_watts', 'int'),
+    # Adapter output voltage
+    ('"AdapterVoltage"', 'adapter_voltage_mv', 'int'),
+    # Adapter maximum current
+    ('"Current"', 'adapter_current_ma', 'int'),
+    # System power consumption (what the Mac is drawing)
+    ('"SystemPowerIn"', 'system_power_mw', 'int'),
+    # Current charging rate
+    ('"ChargingCurrent"', 'charging_current_ma', 'int'),
+    # Voltage used for charging
+    ('"ChargingVoltage"', 'charging_voltage_mv', 'int'),
+    # Individual cell voltages (3-cell battery pack)
+    ('"CellVoltage"', 'cell_voltages', 'cells'),
+)
+
+
+def scan_ioreg_lines(lines: Iterable[str]) -> Dict[str, Any]:
     """
     Parse battery and adapter information from the I/O Registry.
 
-    Queries AppleSmartBattery via ioreg to get detailed hardware-level
-    information about the battery state and connected power adapter.
+    Takes the output of ``ioreg -rn AppleSmartBattery`` and extracts
+    detailed hardware-level information about the battery state and
+    connected power adapter.
+
+    Lines are parsed incrementally: each is only checked against the keys
+    that have not been seen yet, and reading stops as soon as every key
+    has been found, so a caller streaming a pipe does not have to wait
+    for the rest of it. As with a search over the full output, the first
+    occurrence of each key wins.
+
+    Args:
+        lines (iterable[str]): ioreg output lines, e.g. a pipe
 
     Returns:
         dict: Battery information containing:
@@ -113,153 +459,242 @@ def parse_ioreg_battery():
             - charging_current_ma (int): Current charging rate in milliamps
             - charging_voltage_mv (int): Charging voltage in millivolts
             - cell_voltages (list[int]): Individual cell voltages in millivolts
-    """
-    output = run_cmd("ioreg -rn AppleSmartBattery")
-
-    info = {}
 
-    # Current capacity - how much charge the battery currently holds
-    match = re.search(r'"CurrentCapacity"\s*=\s*(\d+)', output)
-    info['current_capacity_mah'] = int(match.group(1)) if match else 0
-
-    # Max capacity - the current maximum the battery can hold (degrades over time)
-    match = re.search(r'"MaxCapacity"\s*=\s*(\d+)', output)
-    info['max_capacity_mah'] = int(match.group(1)) if match else 0
-
-    # Design capacity - the original factory capacity
-    match = re.search(r'"DesignCapacity"=(\d+)', output)
-    info['design_capacity_mah'] = int(match.group(1)) if match else 0
-
-    # Battery voltage - current voltage across the battery
-    match = re.search(r'"Voltage"\s*=\s*(\d+)', output)
-    info['voltage_mv'] = int(match.group(1)) if match else 0
-
-    # Instantaneous amperage - positive when charging, negative when discharging
-    match = re.search(r'"InstantAmperage"\s*=\s*(-?\d+)', output)
-    info['amperage_ma'] = int(match.group(1)) if match else 0
-
-    # Charging state
-    match = re.search(r'"IsCharging"\s*=\s*(Yes|No)', output)
-    info['is_charging'] = match.group(1) == 'Yes' if match else False
+        plus the same readings pre-scaled for display:
+            - voltage_v, adapter_v, charging_voltage_v (float): Volts
+            - adapter_a, charging_a, discharge_a (float): Amps
+            - system_w, charge_w, discharge_w (float): Watts
+            - health_pct (float): Max capacity as a percentage of design
+            - minutes_to_full, minutes_to_empty (int): Estimates at the
+              current charge/discharge rate, or None with no current
+    """
+    info: Dict[str, Any] = {name: (False if kind == 'flag' else 0) for _, name, kind in _IOREG_FIELDS}
+    info['cell_voltages'] = [0, 0, 0]
+
+    remaining = list(_IOREG_FIELDS)
+    for line in lines:
+        for field in [field for field in remaining if field[0] in line]:
+            key, name, kind = field
+            if kind == 'int':
+                info[name] = _find_int(line, key)
+            elif kind == 'flag':
+                info[name] = _find_flag(line, key)
+            else:
+                match = _CELL_VOLTAGE_RE.search(line)
+                if not match:
+                    continue
+                info[name] = [int(match.group(i)) for i in range(1, 4)]
+            remaining.remove(field)
+        if not remaining:
+            break
 
-    # External power connected
-    match = re.search(r'"ExternalConnected"\s*=\s*(Yes|No)', output)
-    info['external_connected'] = match.group(1) == 'Yes' if match else False
+    # Scale once here so the dashboard does not redo it every frame
+    voltage_mv = info['voltage_mv']
+    info['voltage_v'] = voltage_mv / 1000
+    info['adapter_v'] = info['adapter_voltage_mv'] / 1000
+    info['adapter_a'] = info['adapter_current_ma'] / 1000
+    info['system_w'] = info['system_power_mw'] / 1000
+    info['charging_a'] = info['charging_current_ma'] / 1000
+    info['charging_voltage_v'] = info['charging_voltage_mv'] / 1000
+    info['charge_w'] = info['charging_current_ma'] * voltage_mv / 1000000
+    info['discharge_a'] = abs(info['amperage_ma']) / 1000
+    info['discharge_w'] = abs(info['amperage_ma']) * voltage_mv / 1000000
+    design = info['design_capacity_mah']
+    info['health_pct'] = info['max_capacity_mah'] / design * 100 if design > 0 else 0
+
+    # Time estimates at the present rate; mAh over mA gives hours
+    charging_ma = info['charging_current_ma']
+    discharge_ma = abs(info['amperage_ma'])
+    remaining_mah = info['max_capacity_mah'] - info['current_capacity_mah']
+    info['minutes_to_full'] = int(remaining_mah / charging_ma * 60) if charging_ma > 0 else None
+    info['minutes_to_empty'] = (int(info['current_capacity_mah'] / discharge_ma * 60)
+                                if discharge_ma > 0 else None)
 
-    # Cycle count - number of complete charge/discharge cycles
-    match = re.search(r'"CycleCount"=(\d+)', output)
-    info['cycle_count'] = int(match.group(1)) if match else 0
+    return info
 
-    # Adapter wattage rating
-    match = re.search(r'"Watts"=(\d+)', output)
-    info['adapter_watts'] = int(match.group(1)) if match else 0
 
-    # Adapter output voltage
-    match = re.search(r'"AdapterVoltage"=(\d+)', output)
-    info['adapter_voltage_mv'] = int(match.group(1)) if match else 0
+def stream_ioreg_battery() -> Dict[str, Any]:
+    """
+    Run ioreg once and parse its output while it is still being written.
 
-    # Adapter maximum current
-    match = re.search(r'"Current"=(\d+)', output)
-    info['adapter_current_ma'] = int(match.group(1)) if match else 0
+    The process is terminated as soon as scan_ioreg_lines() has every
+    key, and killed if it runs longer than run_cmd()'s 5-second timeout.
 
-    # System power consumption (what the Mac is drawing)
-    match = re.search(r'"SystemPowerIn"=(\d+)', output)
-    info['system_power_mw'] = int(match.group(1)) if match else 0
+    Returns:
+        dict: See scan_ioreg_lines()
+    """
+    try:
+        proc = subprocess.Popen(CMDS['ioreg'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+    except OSError:
+        return scan_ioreg_lines(())
+    assert proc.stdout is not None
+
+    watchdog = threading.Timer(5, proc.kill)
+    watchdog.start()
+    try:
+        return scan_ioreg_lines(proc.stdout)
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
 
-    # Current charging rate
-    match = re.search(r'"ChargingCurrent"=(\d+)', output)
-    info['charging_current_ma'] = int(match.group(1)) if match else 0
 
-    # Voltage used for charging
-    match = re.search(r'"ChargingVoltage"=(\d+)', output)
-    info['charging_voltage_mv'] = int(match.group(1)) if match else 0
+def parse_ioreg_battery() -> Dict[str, Any]:
+    """
+    Query AppleSmartBattery via ioreg and parse the result.
 
-    # Individual cell voltages (3-cell battery pack)
-    match = re.search(r'"CellVoltage"=\((\d+),(\d+),(\d+)\)', output)
-    if match:
-        info['cell_voltages'] = [int(match.group(i)) for i in range(1, 4)]
-    else:
-        info['cell_voltages'] = [0, 0, 0]
+    Every call streams a fresh ioreg run through stream_ioreg_battery(),
+    so ioreg is stopped once the last battery key has been read rather
+    than left to print the rest of its output.
 
-    return info
+    Returns:
+        dict: See scan_ioreg_lines()
+    """
+    return stream_ioreg_battery()
 
 
-def parse_pmset():
+def parse_pmset_from_output(output: str) -> Dict[str, Any]:
     """
     Parse battery status from pmset power management tool.
 
     pmset provides the user-friendly battery percentage and status
     that matches what the menu bar shows.
 
+    Args:
+        output (str): ``pmset -g batt`` stdout
+
     Returns:
         dict: Power management info containing:
             - percentage (int): Battery charge percentage (0-100)
             - status (str): Battery status ('Charging', 'Discharging', 'Fully Charged', 'On AC', 'Unknown')
             - time_remaining (str): Estimated time remaining (if available)
     """
-    output = run_cmd("pmset -g batt")
-
-    info = {}
-
-    # Battery percentage
-    match = re.search(r'(\d+)%', output)
-    info['percentage'] = int(match.group(1)) if match else 0
-
-    # Determine status from output text
-    if 'charging' in output.lower() and 'discharging' not in output.lower():
-        info['status'] = 'Charging'
-    elif 'discharging' in output.lower():
+    info: Dict[str, Any] = {}
+
+    # Everything except the power source is on the battery line, e.g.
+    # " -InternalBattery-0 (id=...)\t87%; charging; 1:23 remaining present: true"
+    pct = output.find('%')
+    if pct >= 0:
+        line_end = output.find('\n', pct)
+        line = output[output.rfind('\n', 0, pct) + 1:line_end if line_end >= 0 else None]
+    else:
+        line = ''
+
+    # Battery percentage - the digits just before the '%'
+    end = line.find('%')
+    start = end
+    while start > 0 and line[start - 1] in '0123456789':
+        start -= 1
+    info['percentage'] = int(line[start:end]) if start < end else 0
+
+    # Determine status; 'discharging' is tested first as it contains 'charging'
+    low = line.lower()
+    if 'discharging' in low:
         info['status'] = 'Discharging'
-    elif 'charged' in output.lower():
+    elif 'charging' in low:
+        info['status'] = 'Charging'
+    elif 'charged' in low:
         info['status'] = 'Fully Charged'
     elif 'AC Power' in output:
         info['status'] = 'On AC'
     else:
         info['status'] = 'Unknown'
 
-    # Time remaining estimate (if provided by system)
-    match = re.search(r'(\d+:\d+)\s*remaining', output)
-    info['time_remaining'] = match.group(1) if match else 'N/A'
+    # Time remaining estimate (if provided by system), e.g. "1:23 remaining"
+    info['time_remaining'] = 'N/A'
+    end = line.find('remaining')
+    if end > 0:
+        words = line[max(0, end - 16):end].split()
+        hours, sep, mins = words[-1].partition(':') if words else ('', '', '')
+        if sep and hours.isdigit() and mins.isdigit():
+            info['time_remaining'] = words[-1]
 
     return info
 
 
-def parse_thermal():
+def parse_pmset() -> Dict[str, Any]:
+    """
+    Run ``pmset -g batt`` and parse the result.
+
+    Returns:
+        dict: See parse_pmset_from_output()
+    """
+    return parse_pmset_from_output(run_cmd(CMDS['pmset_batt']))
+
+
+def parse_thermal_from_output(output: str) -> Dict[str, int]:
     """
     Get thermal throttling information from pmset.
 
     When the Mac gets too hot, macOS reduces CPU speed to manage thermals.
     This function returns the current CPU speed limit percentage.
 
+    Args:
+        output (str): ``pmset -g therm`` stdout
+
     Returns:
         dict: Thermal info containing:
             - cpu_speed_limit (int): CPU speed as percentage of max (100 = no throttling)
     """
-    output = run_cmd("pmset -g therm")
-    info = {}
-    match = re.search(r'CPU_Speed_Limit\s*=\s*(\d+)', output)
-    info['cpu_speed_limit'] = int(match.group(1)) if match else 100
+    info: Dict[str, int] = {}
+    info['cpu_speed_limit'] = _find_int(output, 'CPU_Speed_Limit', default=100)
     return info
 
 
-def get_cpu_usage():
+@_ttl_cache(30)
+def parse_thermal() -> Dict[str, int]:
+    """
+    Run ``pmset -g therm`` and parse the result.
+
+    The throttle limit changes slowly, so results are cached for 30s.
+
+    Returns:
+        dict: See parse_thermal_from_output()
+    """
+    return parse_thermal_from_output(run_cmd(CMDS['pmset_therm']))
+
+
+def get_cpu_usage_from_output(output: str) -> float:
     """
     Get current CPU usage percentage.
 
-    Uses the 'top' command to get a snapshot of CPU utilization.
+    Parses a snapshot of CPU utilization from the 'top' command.
     Returns the sum of user and system CPU time.
 
+    Args:
+        output (str): ``top -l 1 -n 0`` stdout
+
     Returns:
         float: CPU usage percentage (0-100+, can exceed 100 on multi-core)
     """
-    output = run_cmd("top -l 1 -n 0 | grep 'CPU usage'")
-    match = re.search(r'(\d+\.?\d*)%\s*user.*?(\d+\.?\d*)%\s*sys', output)
+    match = _CPU_RE.search(output)
     if match:
         return float(match.group(1)) + float(match.group(2))
     return 0
 
 
-def get_memory_info():
+def get_cpu_usage() -> float:
+    """
+    Get current CPU usage percentage.
+
+    Reads the kernel tick counters directly when libSystem is available,
+    otherwise runs 'top' and parses the CPU usage line.
+
+    Returns:
+        float: See get_cpu_usage_from_output()
+    """
+    if _libc is not None:
+        usage = _host_cpu_usage()
+        if usage is not None:
+            return usage
+    return get_cpu_usage_from_output(run_cmd(CMDS['top']))
+
+
+def get_memory_info_from_output(vm_stat_output: str, memsize_output: str,
+                                pagesize_output: str) -> Dict[str, float]:
     """
     Get detailed memory usage information.
 
@@ -272,6 +707,11 @@ def get_memory_info():
     - Cached: Inactive + Purgeable + Speculative (can be reclaimed)
     - Free: Completely unused memory
 
+    Args:
+        vm_stat_output (str): vm_stat stdout
+        memsize_output (str): ``sysctl -n hw.memsize`` stdout
+        pagesize_output (str): pagesize stdout
+
     Returns:
         dict: Memory statistics containing:
             - total_gb (float): Total physical RAM in GB
@@ -284,22 +724,39 @@ def get_memory_info():
             - used_pct (float): Usage percentage (app + compressed)
     """
     # Get total physical memory
-    output = run_cmd("sysctl -n hw.memsize")
-    total_bytes = int(output.strip()) if output.strip().isdigit() else 16 * 1024**3
-    total_gb = total_bytes / (1024**3)
+    total_bytes = int(memsize_output.strip()) if memsize_output.strip().isdigit() else 16 * 1024**3
 
     # Parse vm_stat output for page counts
-    output = run_cmd("vm_stat")
+    # e.g. "Pages free:                               12345."
     pages = {}
-    for line in output.split('\n'):
-        match = re.match(r'(.+):\s+(\d+)', line)
-        if match:
-            pages[match.group(1).strip()] = int(match.group(2))
+    for line in vm_stat_output.split('\n'):
+        if ':' not in line:
+            continue
+        key, _, value = line.partition(':')
+        value = value.strip()
+        if value.endswith('.'):
+            value = value[:-1]
+        if value.isdigit():
+            pages[key.strip()] = int(value)
 
     # Get page size (16KB on Apple Silicon, 4KB on Intel)
-    page_size_output = run_cmd("pagesize")
-    page_size = int(page_size_output.strip()) if page_size_output.strip().isdigit() else 16384
+    page_size = int(pagesize_output.strip()) if pagesize_output.strip().isdigit() else 16384
+
+    return _memory_breakdown(pages, page_size, total_bytes)
+
+
+def _memory_breakdown(pages: Dict[str, int], page_size: int, total_bytes: int) -> Dict[str, float]:
+    """
+    Turn vm_stat-style page counts into the memory statistics dict.
+
+    Args:
+        pages (dict): Page counts keyed by vm_stat label
+        page_size (int): Page size in bytes
+        total_bytes (int): Total physical RAM in bytes
 
+    Returns:
+        dict: See get_memory_info_from_output()
+    """
     # Calculate memory categories in bytes
     free = pages.get('Pages free', 0) * page_size
     active = pages.get('Pages active', 0) * page_size
@@ -315,7 +772,7 @@ def get_memory_info():
     cached = inactive + purgeable + speculative
 
     return {
-        'total_gb': total_gb,
+        'total_gb': total_bytes / (1024**3),
         'app_gb': app_memory / (1024**3),
         'wired_gb': wired / (1024**3),
         'compressed_gb': compressed / (1024**3),
@@ -326,7 +783,25 @@ def get_memory_info():
     }
 
 
-def get_disk_info():
+def get_memory_info() -> Dict[str, float]:
+    """
+    Get detailed memory usage information.
+
+    Reads host_statistics64() directly when libSystem is available,
+    otherwise runs vm_stat, sysctl and pagesize and parses the results.
+
+    Returns:
+        dict: See get_memory_info_from_output()
+    """
+    if _libc is not None:
+        sample = _host_memory_pages()
+        if sample is not None:
+            return _memory_breakdown(*sample)
+    return get_memory_info_from_output(
+        run_cmd(CMDS['vm_stat']), run_cmd(CMDS['memsize']), run_cmd(CMDS['pagesize']))
+
+
+def get_disk_info_from_output(output: str) -> Dict[str, float]:
     """
     Get disk space information for the boot volume.
 
@@ -340,6 +815,9 @@ def get_disk_info():
     - Volume Used Space: Space used by the specific volume
     - Purgeable: Space that can be reclaimed (caches, Time Machine local snapshots)
 
+    Args:
+        output (str): ``diskutil info /`` stdout
+
     Returns:
         dict: Disk statistics containing:
             - total_gb (float): Total container capacity in GB
@@ -348,37 +826,30 @@ def get_disk_info():
             - purgeable_gb (float): Purgeable space in GB
             - used_pct (int): Usage percentage
     """
-    info = {'total_gb': 0, 'used_gb': 0, 'available_gb': 0, 'used_pct': 0, 'purgeable_gb': 0}
+    info: Dict[str, float] = {'total_gb': 0, 'used_gb': 0, 'available_gb': 0, 'used_pct': 0, 'purgeable_gb': 0}
 
-    # Get container info from diskutil for accurate APFS reporting
-    output = run_cmd("diskutil info /")
-
-    # Parse Container Total Space (total APFS container capacity)
-    match = re.search(r'Container Total Space:\s*([\d.]+)\s*(GB|TB)', output)
-    if match:
-        size = float(match.group(1))
-        if match.group(2) == 'TB':
+    # Collect all three space fields in one pass, normalised to GB
+    sizes: Dict[str, float] = {}
+    for match in _DISK_RE.finditer(output):
+        size = float(match.group('size'))
+        if match.group('unit') == 'TB':
             size *= 1024
-        info['total_gb'] = size
+        elif match.group('unit') == 'MB':
+            size /= 1024
+        sizes.setdefault(match.group('k'), size)
 
-    # Parse Container Free Space (actual available in container)
-    match = re.search(r'Container Free Space:\s*([\d.]+)\s*(GB|TB)', output)
-    if match:
-        size = float(match.group(1))
-        if match.group(2) == 'TB':
-            size *= 1024
-        info['available_gb'] = size
-        info['purgeable_gb'] = size  # On APFS, free space is inherently purgeable
+    # Container Total Space (total APFS container capacity)
+    if 'Container Total Space' in sizes:
+        info['total_gb'] = sizes['Container Total Space']
 
-    # Parse volume used space
-    match = re.search(r'Volume Used Space:\s*([\d.]+)\s*(GB|TB|MB)', output)
-    if match:
-        size = float(match.group(1))
-        if match.group(2) == 'TB':
-            size *= 1024
-        elif match.group(2) == 'MB':
-            size /= 1024
-        info['used_gb'] = size
+    # Container Free Space (actual available in container)
+    if 'Container Free Space' in sizes:
+        info['available_gb'] = sizes['Container Free Space']
+        info['purgeable_gb'] = sizes['Container Free Space']  # On APFS, free space is inherently purgeable
+
+    # Volume used space
+    if 'Volume Used Space' in sizes:
+        info['used_gb'] = sizes['Volume Used Space']
 
     # Calculate used from total - free if not directly available
     if info['used_gb'] == 0 and info['total_gb'] > 0:
@@ -391,39 +862,285 @@ def get_disk_info():
     return info
 
 
+@_ttl_cache(300)
+def get_disk_info() -> Dict[str, float]:
+    """
+    Run ``diskutil info /`` and parse the result.
+
+    diskutil is used for accurate APFS container space reporting. Disk
+    usage changes slowly, so results are cached for 5 minutes.
+
+    Returns:
+        dict: See get_disk_info_from_output()
+    """
+    return get_disk_info_from_output(run_cmd(CMDS['diskutil']))
+
+
+# Zero-argument collectors for each data source
+SOURCES: Dict[str, Callable[[], Any]] = {
+    'battery': parse_ioreg_battery,
+    'pmset': parse_pmset,
+    'thermal': parse_thermal,
+    'cpu': get_cpu_usage,
+    'memory': get_memory_info,
+    'disk': get_disk_info,
+}
+
+# Refresh tiers: seconds between samples, and the sources each tier refreshes.
+# Adapter rating, design capacity and cycle count come from the same ioreg
+# sample as power draw and voltage, so they ride along in the fast tier.
+TIER_INTERVALS = {'fast': 2, 'med': 5, 'normal': 10, 'slow': 60}
+TIER_SOURCES = {
+    'fast': ('cpu', 'battery'),     # CPU load, power draw, voltage, current
+    'med': ('memory', 'thermal'),   # Memory pressure, throttling
+    'normal': ('pmset',),           # Battery charge and status
+    'slow': ('disk',),              # Disk capacity
+}
+
+# Number of system power samples kept for the trend line (4 minutes at 2s)
+HISTORY_LEN = 120
+
+
+def gather_all(sources: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Collect data sources for one dashboard refresh.
+
+    The requested sources are started together on the worker pool, so a
+    refresh takes as long as the slowest one rather than the sum. CPU and
+    memory only spawn commands when the Mach calls are unavailable.
+
+    Args:
+        sources (iterable): Names from SOURCES to collect (default: all)
+
+    Returns:
+        dict: Parsed samples keyed by source name
+    """
+    if sources is None:
+        sources = SOURCES
+    futures = {name: _POOL.submit(SOURCES[name]) for name in sources}
+    wait(futures.values())
+    return {name: future.result() for name, future in futures.items()}
+
+
+class Collector(threading.Thread):
+    """
+    Daemon thread that keeps a snapshot of every data source current.
+
+    Each pass collects the tiers whose interval has expired, then sleeps
+    until the next tier is due or a refresh is requested. Results are
+    published by swapping in a new dict, which is a single atomic
+    assignment under the GIL, so the render loop reads ``snapshot``
+    without taking a lock and never waits on a gather.
+
+    Attributes:
+        snapshot (dict): Latest sample per source name (see SOURCES), plus
+            'power_history', a tuple of recent system power draws in mW
+        next_update (float): Time the next tier is due
+        error (Exception): What stopped the thread if a collector raised,
+            for the render loop to re-raise; None while running
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.snapshot: Dict[str, Any] = {}
+        self.next_update: float = 0.0
+        self.error: Optional[Exception] = None
+        self._last: Dict[str, float] = {tier: 0 for tier in TIER_INTERVALS}
+        self._power_history: Deque[int] = deque(maxlen=HISTORY_LEN)
+        self._history_sample: Optional[Dict[str, Any]] = None
+        self._refresh = threading.Event()
+        self._stopping = threading.Event()
+
+    def refresh(self) -> None:
+        """Collect every tier on the next pass, bypassing caches."""
+        self._refresh.set()
+
+    def stop(self) -> None:
+        """Ask the thread to exit after its current pass."""
+        self._stopping.set()
+        self._refresh.set()
+
+    def run(self) -> None:
+        try:
+            self._collect()
+        except Exception as exc:
+            self.error = exc
+
+    def _collect(self) -> None:
+        """Collect due tiers until stop() is called."""
+        while not self._stopping.is_set():
+            if self._refresh.is_set():
+                self._refresh.clear()
+                self._last = {tier: 0 for tier in TIER_INTERVALS}
+                for collect in SOURCES.values():
+                    if hasattr(collect, 'cache_clear'):
+                        collect.cache_clear()
+
+            started = time.time()
+            due = [tier for tier, interval in TIER_INTERVALS.items()
+                   if started - self._last[tier] >= interval]
+            if due:
+                sources = [name for tier in due for name in TIER_SOURCES[tier]]
+                snapshot = dict(self.snapshot)
+                snapshot.update(gather_all(sources))
+                # Passes that skip the fast tier carry the previous battery
+                # sample over; only a new sample adds to the history
+                if snapshot['battery'] is not self._history_sample:
+                    self._history_sample = snapshot['battery']
+                    self._power_history.append(snapshot['battery']['system_power_mw'])
+                    snapshot['power_history'] = tuple(self._power_history)
+                for tier in due:
+                    self._last[tier] = started
+                self.snapshot = snapshot
+
+            self.next_update = min(self._last[tier] + interval
+                                   for tier, interval in TIER_INTERVALS.items())
+            self._refresh.wait(max(0, self.next_update - time.time()))
+
+
 # =============================================================================
 # Display Functions
 # =============================================================================
 
-def make_bar(pct, width=30, fill='█', empty='░'):
+# Static layout text, built once rather than on every frame
+RULE = "=" * 65
+VALUE_COL = 18  # Values start after a 16-character label at column 2
+
+TITLES = {
+    'power': "⚡ POWER SOURCE",
+    'system': "💻 SYSTEM",
+    'memory': "🧠 MEMORY",
+    'disk': "💾 DISK",
+    'battery': "🔋 BATTERY",
+    'charging': "⚡ CHARGING",
+    'discharging': "🔌 DISCHARGING",
+    'balance': "📊 POWER BALANCE",
+}
+
+LABELS = {
+    'adapter': "Adapter:        ",
+    'adapter_voltage': "Voltage:        ",
+    'source': "Source:         ",
+    'power_draw': "Power Draw:     ",
+    'trend': "Trend:          ",
+    'cpu': "CPU Usage:      ",
+    'throttle': "CPU Throttle:   ",
+    'used': "Used:           ",
+    'charge': "Charge:         ",
+    'capacity': "Capacity:       ",
+    'health': "Health:         ",
+    'voltage': "Voltage:        ",
+    'cells': "Cells:          ",
+    'power': "Power:          ",
+    'time_to_full': "Time to Full:   ",
+    'time_to_empty': "Time to Empty:  ",
+}
+
+FOOTER_KEYS = " [Q] Quit  [R] Refresh  Next update: "
+
+# Color ladder thresholds. "Load" values (higher is worse) pick from
+# (GREEN, YELLOW, RED) with bisect_right; "level" values (higher is
+# better) pick from (RED, YELLOW, GREEN) with bisect_left.
+CPU_LOAD_STEPS = (50, 80)
+USAGE_LOAD_STEPS = (70, 90)
+BATTERY_LEVEL_STEPS = (20, 50)
+HEALTH_LEVEL_STEPS = (60, 80)
+
+# Progress bars are sliced out of one pre-encoded UTF-8 template, so curses
+# gets bytes and nothing is encoded per frame. Both glyphs are 3 bytes.
+BAR_FILL = '█'.encode('utf-8')
+BAR_EMPTY = '░'.encode('utf-8')
+BAR_MAX_WIDTH = 60
+_BAR_TEMPLATE = BAR_FILL * BAR_MAX_WIDTH + BAR_EMPTY * BAR_MAX_WIDTH
+
+
+def make_bar(pct: float, width: int = 30) -> bytes:
     """
-    Create an ASCII progress bar.
+    Create a progress bar as UTF-8 bytes.
 
     Args:
         pct (float): Percentage to fill (0-100)
-        width (int): Total width of the bar in characters
-        fill (str): Character to use for filled portion
-        empty (str): Character to use for empty portion
+        width (int): Total width of the bar in characters (max BAR_MAX_WIDTH)
 
     Returns:
-        str: Progress bar string of specified width
+        bytes: Progress bar of specified width, ready for addstr()
 
     Example:
-        >>> make_bar(75, 20)
+        >>> make_bar(75, 20).decode()
         '███████████████░░░░░'
     """
-    pct = max(0, min(100, pct))  # Clamp to 0-100
-    filled = int(width * pct / 100)
-    return fill * filled + empty * (width - filled)
+    return _bar(max(0, min(100, int(pct))), width)  # Clamp to 0-100
+
 
+@lru_cache(maxsize=512)
+def _bar(pct: int, width: int) -> bytes:
+    """
+    Build a progress bar for an integer percentage.
 
-def draw_dashboard(stdscr):
+    Inputs are bounded (0-100 and a handful of widths), so every bar the
+    dashboard ever draws ends up cached after the first few frames.
+    """
+    start = len(BAR_FILL) * (BAR_MAX_WIDTH - width * pct // 100)
+    return _BAR_TEMPLATE[start:start + len(BAR_FILL) * width]
+
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+# Smallest power range the trend line spreads over its full height, so
+# a few hundred mW of jitter on a steady draw does not look like a swing
+POWER_TREND_MIN_SPAN_MW = 5000
+
+
+def make_sparkline(values: Sequence[float], width: int = 40, min_span: float = 0) -> str:
+    """
+    Create a sparkline of the most recent samples.
+
+    Heights are scaled up from the smallest sample shown, over the range
+    of the samples or min_span, whichever is larger, so the line reflects
+    the shape of the trend and a steady draw stays flat.
+
+    Args:
+        values (sequence): Samples, oldest first
+        width (int): Maximum number of samples to draw
+        min_span (float): Smallest range mapped onto the full height
+
+    Returns:
+        str: One character per sample, at most width long
+
+    Example:
+        >>> make_sparkline([0, 4, 8], 3)
+        '▁▄█'
+    """
+    recent = values[-width:]
+    low = min(recent, default=0)
+    span = max(max(recent, default=0) - low, min_span)
+    if span <= 0:
+        return SPARK_CHARS[0] * len(recent)
+    top = len(SPARK_CHARS) - 1
+    return ''.join(SPARK_CHARS[int((v - low) / span * top)] for v in recent)
+
+
+def _clip(text: Union[str, bytes], room: int) -> Union[str, bytes]:
+    """
+    Cut text to at most room characters.
+
+    Bars are UTF-8 bytes, which are never shorter than the text they
+    encode, so they are only decoded when they might not fit.
+    """
+    if len(text) <= room:
+        return text
+    if isinstance(text, bytes):
+        return text.decode()[:room].encode()
+    return text[:room]
+
+
+def draw_dashboard(stdscr: 'curses.window') -> None:
     """
     Main dashboard rendering loop using curses.
 
     This function handles:
     - Curses initialization and color setup
-    - Periodic data collection (every 10 seconds)
+    - Tiered background data collection (every 2 to 60 seconds)
     - Screen rendering with colored output
     - User input handling (q=quit, r=refresh)
 
@@ -432,7 +1149,7 @@ def draw_dashboard(stdscr):
 
     The dashboard displays:
     - Power source (adapter info)
-    - System power draw and CPU usage
+    - System power draw (with trend line) and CPU usage
     - Memory usage breakdown
     - Disk space information
     - Battery status and health
@@ -440,7 +1157,6 @@ def draw_dashboard(stdscr):
     - Power balance with headroom calculation
     """
     curses.curs_set(0)  # Hide cursor
-    stdscr.nodelay(1)   # Non-blocking input
 
     # Initialize color pairs for terminal output
     curses.start_color()
@@ -458,199 +1174,285 @@ def draw_dashboard(stdscr):
     WHITE = curses.color_pair(5)
     BOLD = curses.A_BOLD
 
-    last_update = 0
-    update_interval = 10  # Seconds between data refreshes
-
-    # Initialize data variables
-    battery = pmset = thermal = memory = disk = None
-    cpu = 0
+    # Color ladders indexed by bisect over the *_STEPS thresholds
+    LOAD_COLORS = (GREEN, YELLOW, RED)
+    LEVEL_COLORS = (RED, YELLOW, GREEN)
+
+    # Data is gathered on a background thread; each frame renders its snapshot
+    collector = Collector()
+    collector.start()
+
+    # Rows drawn in the previous frame: row -> (static, values), where each
+    # part is a list of (col, text, attr) segments
+    Segments = List[Tuple[int, Union[str, bytes], int]]
+    prev_rows: Dict[int, Tuple[Segments, Segments]] = {}
+    prev_size: Optional[Tuple[int, int]] = None
+    frame: Dict[int, Tuple[Segments, Segments]] = {}
+
+    # Off-screen pad holding the static layout (titles, labels, rules) and
+    # the static segments it was last drawn with
+    background: Any = None
+    layout = None
+
+    # Header text and the second it was formatted for
+    header = ""
+    header_second = None
+
+    # Segments are clipped to the window (and dropped past its edge) so
+    # none wraps onto the next row, which the row diff would not repaint
+    def label(row: int, col: int, text: Union[str, bytes], attr: int) -> None:
+        """Queue static layout text; it is drawn once into the background pad."""
+        if col < width - 1:
+            frame.setdefault(row, ([], []))[0].append((col, _clip(text, width - col - 1), attr))
+
+    def put(row: int, col: int, text: Union[str, bytes], attr: int) -> None:
+        """Queue a value for the current frame instead of drawing it now."""
+        if col < width - 1:
+            frame.setdefault(row, ([], []))[1].append((col, _clip(text, width - col - 1), attr))
 
     while True:
-        current_time = time.time()
+        # Block in getch() until a key arrives or the next tier is due,
+        # waking at least every 0.5s for the clock and quickly while a
+        # gather is in flight
+        remaining = collector.next_update - time.time()
+        timeout_s = min(0.5, remaining) if remaining > 0 else 0.05
+        stdscr.timeout(max(50, int(timeout_s * 1000)))
 
         # Handle user input
         key = stdscr.getch()
+        current_time = time.time()
         if key == ord('q') or key == ord('Q'):
             break
         elif key == ord('r') or key == ord('R'):
-            last_update = 0  # Force immediate refresh
-
-        # Collect data at specified interval
-        if current_time - last_update >= update_interval:
-            battery = parse_ioreg_battery()
-            pmset = parse_pmset()
-            thermal = parse_thermal()
-            cpu = get_cpu_usage()
-            memory = get_memory_info()
-            disk = get_disk_info()
-            last_update = current_time
+            collector.refresh()  # Force immediate refresh
+
+        # Read the published snapshot once per frame; a collector that
+        # raised has stopped, so surface its error rather than go stale
+        if collector.error is not None:
+            raise collector.error
+        snap = collector.snapshot
 
         # Skip rendering if data not yet collected
-        if battery is None:
+        if not all(name in snap for name in SOURCES):
             continue
 
-        # Clear screen and get dimensions
-        stdscr.erase()
+        battery: Dict[str, Any] = snap['battery']
+        pmset: Dict[str, Any] = snap['pmset']
+        thermal: Dict[str, int] = snap['thermal']
+        cpu: float = snap['cpu']
+        memory: Dict[str, float] = snap['memory']
+        disk: Dict[str, float] = snap['disk']
+
+        # Start a new frame and get dimensions
+        frame = {}
         height, width = stdscr.getmaxyx()
 
         row = 0
 
-        # === Header ===
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header = f" MacBook Power Monitor - {now} "
-        stdscr.addstr(row, 0, "=" * min(width-1, 65), CYAN | BOLD)
+        # === Header === (clock text only changes once per second)
+        second = int(current_time)
+        if second != header_second:
+            now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            header = f" MacBook Power Monitor - {now} ".center(65)
+            header_second = second
+        rule = RULE[:width - 1]
+        label(row, 0, rule, CYAN | BOLD)
         row += 1
-        stdscr.addstr(row, 0, header.center(65), CYAN | BOLD)
+        put(row, 0, header, CYAN | BOLD)
         row += 1
-        stdscr.addstr(row, 0, "=" * min(width-1, 65), CYAN | BOLD)
+        label(row, 0, rule, CYAN | BOLD)
         row += 2
 
         # === Power Source Section ===
-        stdscr.addstr(row, 0, "⚡ POWER SOURCE", YELLOW | BOLD)
+        label(row, 0, TITLES['power'], YELLOW | BOLD)
         row += 1
         if battery['external_connected']:
-            stdscr.addstr(row, 2, f"Adapter:        {battery['adapter_watts']}W", GREEN)
+            label(row, 2, LABELS['adapter'], GREEN)
+            put(row, VALUE_COL, f"{battery['adapter_watts']}W", GREEN)
             row += 1
-            stdscr.addstr(row, 2, f"Voltage:        {battery['adapter_voltage_mv']/1000:.1f}V @ {battery['adapter_current_ma']/1000:.1f}A max", WHITE)
+            label(row, 2, LABELS['adapter_voltage'], WHITE)
+            put(row, VALUE_COL, f"{battery['adapter_v']:.1f}V @ {battery['adapter_a']:.1f}A max", WHITE)
         else:
-            stdscr.addstr(row, 2, "Source:         Battery Only", YELLOW)
+            label(row, 2, LABELS['source'], YELLOW)
+            put(row, VALUE_COL, "Battery Only", YELLOW)
         row += 2
 
         # === System Section ===
-        stdscr.addstr(row, 0, "💻 SYSTEM", YELLOW | BOLD)
+        label(row, 0, TITLES['system'], YELLOW | BOLD)
+        row += 1
+        system_w = battery['system_w']
+        label(row, 2, LABELS['power_draw'], WHITE)
+        put(row, VALUE_COL, f"{system_w:.1f}W", WHITE)
         row += 1
-        system_w = battery['system_power_mw'] / 1000
-        stdscr.addstr(row, 2, f"Power Draw:     {system_w:.1f}W", WHITE)
+        label(row, 2, LABELS['trend'], WHITE)
+        put(row, VALUE_COL, make_sparkline(snap['power_history'], 40, POWER_TREND_MIN_SPAN_MW), CYAN)
         row += 1
 
         # CPU usage with color-coded bar
-        cpu_color = GREEN if cpu < 50 else YELLOW if cpu < 80 else RED
-        stdscr.addstr(row, 2, f"CPU Usage:      ", WHITE)
-        stdscr.addstr(row, 18, make_bar(cpu, 20), cpu_color)
-        stdscr.addstr(row, 40, f" {cpu:.1f}%", WHITE)
+        cpu_color = LOAD_COLORS[bisect.bisect_right(CPU_LOAD_STEPS, cpu)]
+        label(row, 2, LABELS['cpu'], WHITE)
+        put(row, VALUE_COL, make_bar(cpu, 20), cpu_color)
+        put(row, 40, f" {cpu:.1f}%", WHITE)
         row += 1
 
         # CPU throttle status
         throttle_color = WHITE if thermal['cpu_speed_limit'] == 100 else RED
-        stdscr.addstr(row, 2, f"CPU Throttle:   {thermal['cpu_speed_limit']}%", throttle_color)
+        label(row, 2, LABELS['throttle'], throttle_color)
+        put(row, VALUE_COL, f"{thermal['cpu_speed_limit']}%", throttle_color)
         row += 2
 
         # === Memory Section ===
-        stdscr.addstr(row, 0, "🧠 MEMORY", YELLOW | BOLD)
+        label(row, 0, TITLES['memory'], YELLOW | BOLD)
         row += 1
-        mem_color = GREEN if memory['used_pct'] < 70 else YELLOW if memory['used_pct'] < 90 else RED
-        stdscr.addstr(row, 2, f"Used:           {memory['app_gb']:.1f}/{memory['total_gb']:.0f} GB ({memory['used_pct']:.0f}%)  ", WHITE)
-        stdscr.addstr(row, 42, make_bar(memory['used_pct'], 15), mem_color)
+        mem_color = LOAD_COLORS[bisect.bisect_right(USAGE_LOAD_STEPS, memory['used_pct'])]
+        label(row, 2, LABELS['used'], WHITE)
+        put(row, VALUE_COL, f"{memory['app_gb']:.1f}/{memory['total_gb']:.0f} GB ({memory['used_pct']:.0f}%)  ", WHITE)
+        put(row, 42, make_bar(memory['used_pct'], 15), mem_color)
         row += 1
-        stdscr.addstr(row, 2, f"Wired: {memory['wired_gb']:.1f}GB  Compressed: {memory['compressed_gb']:.1f}GB  Cached: {memory['cached_gb']:.1f}GB", WHITE)
+        put(row, 2, f"Wired: {memory['wired_gb']:.1f}GB  Compressed: {memory['compressed_gb']:.1f}GB  Cached: {memory['cached_gb']:.1f}GB", WHITE)
         row += 2
 
         # === Disk Section ===
-        stdscr.addstr(row, 0, "💾 DISK", YELLOW | BOLD)
+        label(row, 0, TITLES['disk'], YELLOW | BOLD)
         row += 1
-        disk_color = GREEN if disk['used_pct'] < 70 else YELLOW if disk['used_pct'] < 90 else RED
-        stdscr.addstr(row, 2, f"Used:           {disk['used_gb']:.0f}/{disk['total_gb']:.0f} GB ({disk['used_pct']}%)  ", WHITE)
-        stdscr.addstr(row, 42, make_bar(disk['used_pct'], 15), disk_color)
+        disk_color = LOAD_COLORS[bisect.bisect_right(USAGE_LOAD_STEPS, disk['used_pct'])]
+        label(row, 2, LABELS['used'], WHITE)
+        put(row, VALUE_COL, f"{disk['used_gb']:.0f}/{disk['total_gb']:.0f} GB ({disk['used_pct']}%)  ", WHITE)
+        put(row, 42, make_bar(disk['used_pct'], 15), disk_color)
         row += 1
-        stdscr.addstr(row, 2, f"Available: {disk['available_gb']:.0f}GB  Purgeable: {disk['purgeable_gb']:.1f}GB", WHITE)
+        put(row, 2, f"Available: {disk['available_gb']:.0f}GB  Purgeable: {disk['purgeable_gb']:.1f}GB", WHITE)
         row += 2
 
         # === Battery Section ===
-        stdscr.addstr(row, 0, "🔋 BATTERY", YELLOW | BOLD)
+        label(row, 0, TITLES['battery'], YELLOW | BOLD)
         row += 1
         batt_pct = pmset['percentage']
-        batt_color = GREEN if batt_pct > 50 else YELLOW if batt_pct > 20 else RED
-        stdscr.addstr(row, 2, f"Charge:         ", WHITE)
-        stdscr.addstr(row, 18, make_bar(batt_pct, 20), batt_color)
+        batt_color = LEVEL_COLORS[bisect.bisect_left(BATTERY_LEVEL_STEPS, batt_pct)]
+        label(row, 2, LABELS['charge'], WHITE)
+        put(row, VALUE_COL, make_bar(batt_pct, 20), batt_color)
         status_color = GREEN if battery['is_charging'] else WHITE
-        stdscr.addstr(row, 40, f" {batt_pct}% {pmset['status']}", status_color)
+        put(row, 40, f" {batt_pct}% {pmset['status']}", status_color)
         row += 1
-        stdscr.addstr(row, 2, f"Capacity:       {battery['current_capacity_mah']}/{battery['max_capacity_mah']} mAh", WHITE)
+        label(row, 2, LABELS['capacity'], WHITE)
+        put(row, VALUE_COL, f"{battery['current_capacity_mah']}/{battery['max_capacity_mah']} mAh", WHITE)
         row += 1
 
-        # Battery health calculation
-        health = (battery['max_capacity_mah'] / battery['design_capacity_mah'] * 100) if battery['design_capacity_mah'] > 0 else 0
-        health_color = GREEN if health > 80 else YELLOW if health > 60 else RED
-        stdscr.addstr(row, 2, f"Health:         {health:.1f}%  Cycles: {battery['cycle_count']}", health_color)
+        health = battery['health_pct']
+        health_color = LEVEL_COLORS[bisect.bisect_left(HEALTH_LEVEL_STEPS, health)]
+        label(row, 2, LABELS['health'], health_color)
+        put(row, VALUE_COL, f"{health:.1f}%  Cycles: {battery['cycle_count']}", health_color)
         row += 1
-        stdscr.addstr(row, 2, f"Voltage:        {battery['voltage_mv']/1000:.2f}V", WHITE)
+        label(row, 2, LABELS['voltage'], WHITE)
+        put(row, VALUE_COL, f"{battery['voltage_v']:.2f}V", WHITE)
         row += 1
         cells = battery['cell_voltages']
-        stdscr.addstr(row, 2, f"Cells:          {cells[0]}mV | {cells[1]}mV | {cells[2]}mV", WHITE)
+        label(row, 2, LABELS['cells'], WHITE)
+        put(row, VALUE_COL, f"{cells[0]}mV | {cells[1]}mV | {cells[2]}mV", WHITE)
         row += 2
 
         # === Charging/Discharging Section ===
         if battery['is_charging']:
-            stdscr.addstr(row, 0, "⚡ CHARGING", GREEN | BOLD)
+            label(row, 0, TITLES['charging'], GREEN | BOLD)
             row += 1
-            charge_power = battery['charging_current_ma'] * battery['voltage_mv'] / 1000000
-            stdscr.addstr(row, 2, f"Power:          {charge_power:.1f}W ({battery['charging_current_ma']/1000:.2f}A @ {battery['charging_voltage_mv']/1000:.2f}V)", WHITE)
+            label(row, 2, LABELS['power'], WHITE)
+            put(row, VALUE_COL, f"{battery['charge_w']:.1f}W ({battery['charging_a']:.2f}A @ {battery['charging_voltage_v']:.2f}V)", WHITE)
             row += 1
 
-            # Time to full calculation
-            remaining_mah = battery['max_capacity_mah'] - battery['current_capacity_mah']
-            if battery['charging_current_ma'] > 0:
-                hours_to_full = remaining_mah / battery['charging_current_ma']
-                mins = int(hours_to_full * 60)
-                h, m = divmod(mins, 60)
-                stdscr.addstr(row, 2, f"Time to Full:   {h}h {m:02d}m", GREEN)
+            if battery['minutes_to_full'] is not None:
+                h, m = divmod(battery['minutes_to_full'], 60)
+                label(row, 2, LABELS['time_to_full'], GREEN)
+                put(row, VALUE_COL, f"{h}h {m:02d}m", GREEN)
         elif not battery['external_connected']:
-            stdscr.addstr(row, 0, "🔌 DISCHARGING", YELLOW | BOLD)
+            label(row, 0, TITLES['discharging'], YELLOW | BOLD)
             row += 1
-            discharge_ma = abs(battery['amperage_ma'])
-            discharge_power = discharge_ma * battery['voltage_mv'] / 1000000
-            stdscr.addstr(row, 2, f"Power:          {discharge_power:.1f}W ({discharge_ma/1000:.2f}A)", WHITE)
+            label(row, 2, LABELS['power'], WHITE)
+            put(row, VALUE_COL, f"{battery['discharge_w']:.1f}W ({battery['discharge_a']:.2f}A)", WHITE)
             row += 1
 
-            # Time to empty calculation
-            if discharge_ma > 0:
-                hours = battery['current_capacity_mah'] / discharge_ma
-                mins = int(hours * 60)
-                h, m = divmod(mins, 60)
-                stdscr.addstr(row, 2, f"Time to Empty:  {h}h {m:02d}m", YELLOW)
+            if battery['minutes_to_empty'] is not None:
+                h, m = divmod(battery['minutes_to_empty'], 60)
+                label(row, 2, LABELS['time_to_empty'], YELLOW)
+                put(row, VALUE_COL, f"{h}h {m:02d}m", YELLOW)
         row += 2
 
         # === Power Balance Section (when on AC power) ===
         if battery['external_connected']:
-            stdscr.addstr(row, 0, "📊 POWER BALANCE", YELLOW | BOLD)
+            label(row, 0, TITLES['balance'], YELLOW | BOLD)
             row += 1
 
             adapter_max = battery['adapter_watts']
             system = system_w
-            charge = battery['charging_current_ma'] * battery['voltage_mv'] / 1000000 if battery['is_charging'] else 0
+            charge = battery['charge_w'] if battery['is_charging'] else 0
             total = system + charge
             headroom = adapter_max - total
             pct = min(100, total / adapter_max * 100) if adapter_max > 0 else 0
 
-            stdscr.addstr(row, 2, f"System: {system:.0f}W + Charging: {charge:.0f}W = {total:.0f}W / {adapter_max}W", WHITE)
+            put(row, 2, f"System: {system:.0f}W + Charging: {charge:.0f}W = {total:.0f}W / {adapter_max}W", WHITE)
             row += 1
-            bar_color = GREEN if pct < 70 else YELLOW if pct < 90 else RED
-            stdscr.addstr(row, 2, f"[{make_bar(pct, 40)}] {pct:.0f}%", bar_color)
+            bar_color = LOAD_COLORS[bisect.bisect_right(USAGE_LOAD_STEPS, pct)]
+            put(row, 2, "[", bar_color)
+            put(row, 3, make_bar(pct, 40), bar_color)
+            put(row, 43, f"] {pct:.0f}%", bar_color)
             row += 1
 
             # Headroom indicator
             if headroom >= 0:
                 headroom_color = GREEN if headroom > 20 else YELLOW
-                stdscr.addstr(row, 2, f"Headroom: {headroom:.0f}W", headroom_color)
+                put(row, 2, f"Headroom: {headroom:.0f}W", headroom_color)
             else:
-                stdscr.addstr(row, 2, f"Battery supplementing: {-headroom:.0f}W (adapter maxed)", RED)
+                put(row, 2, f"Battery supplementing: {-headroom:.0f}W (adapter maxed)", RED)
             row += 2
 
         # === Footer ===
-        countdown = int(update_interval - (current_time - last_update))
-        stdscr.addstr(row, 0, "=" * min(width-1, 65), CYAN)
+        countdown = max(0, int(collector.next_update - current_time))
+        label(row, 0, rule, CYAN)
         row += 1
-        stdscr.addstr(row, 0, f" [Q] Quit  [R] Refresh  Next update: {countdown}s ", WHITE)
-
-        stdscr.refresh()
-        time.sleep(0.5)  # Small delay to reduce CPU usage
+        label(row, 0, FOOTER_KEYS, WHITE)
+        put(row, len(FOOTER_KEYS), f"{countdown}s ", WHITE)
+
+        if (height, width) != prev_size:
+            stdscr.erase()
+            background = curses.newpad(height, width)
+            layout = None
+            prev_rows = {}
+            prev_size = (height, width)
+
+        # Redraw the background pad only when the static layout changes
+        new_layout = {row: static for row, (static, _) in frame.items() if row < height}
+        if new_layout != layout:
+            background.erase()
+            for row, static in new_layout.items():
+                for col, text, attr in static:
+                    background.addstr(row, col, text, attr)
+            layout = new_layout
+
+        # Repaint only the rows whose content changed since the last frame:
+        # copying the pad row (overwrite() is copywin() without overlay)
+        # restores its labels and blanks the rest, then only the values
+        # are written on top
+        changed = False
+        for row in sorted(frame.keys() | prev_rows.keys()):
+            segments = frame.get(row)
+            if row >= height or segments == prev_rows.get(row):
+                continue
+            background.overwrite(stdscr, row, 0, row, 0, row, width - 1)
+            for col, text, attr in (segments[1] if segments else ()):
+                stdscr.addstr(row, col, text, attr)  # type: ignore[arg-type]
+            changed = True
+        prev_rows = frame
+
+        if changed:
+            stdscr.noutrefresh()
+            curses.doupdate()
+
+    collector.stop()
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 
-def main():
+def main() -> None:
     """
     Application entry point.
 